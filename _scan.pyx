@@ -0,0 +1,127 @@
+# cython: language_level=3
+"""
+Optional native version of scanner.classify_directory().
+Reads each directory with opendir/readdir and classifies entries by d_type in C,
+creating Python objects only for subdirectories and the final result.
+
+Build it next to scanner.py with:  cythonize -i _scan.pyx
+scanner.py falls back to its os.scandir implementation when it isn't built.
+"""
+from libc.stdlib cimport malloc, free
+from libc.string cimport strcmp, strrchr
+from posix.stat cimport struct_stat, lstat, stat, S_ISDIR, S_ISLNK
+from posix.types cimport ino_t
+import os
+
+cdef extern from "Python.h":
+    object PyUnicode_DecodeFSDefault(const char *s)
+
+cdef extern from "dirent.h" nogil:
+    ctypedef struct DIR:
+        pass
+    struct dirent:
+        ino_t d_ino
+        unsigned char d_type
+        char d_name[1]
+    DIR *opendir(const char *name)
+    dirent *readdir(DIR *dirp)
+    int closedir(DIR *dirp)
+    enum:
+        DT_UNKNOWN
+        DT_DIR
+        DT_REG
+        DT_LNK
+
+# Code extensions without the dot; the bytes objects in _ext_refs own the memory
+cdef const char **_exts = NULL
+cdef Py_ssize_t _n_exts = 0
+cdef list _ext_refs = []
+
+def set_code_extensions(extensions):
+    """
+    Sets the extensions (e.g. '.py') that mark a file as code.
+    """
+    global _exts, _n_exts, _ext_refs
+    refs = [os.fsencode(ext[1:]) for ext in extensions]
+    cdef const char **exts = <const char **>malloc(len(refs) * sizeof(char *))
+    if exts == NULL:
+        raise MemoryError()
+    cdef Py_ssize_t i
+    for i in range(len(refs)):
+        exts[i] = <bytes>refs[i]
+    free(_exts)
+    _exts, _n_exts, _ext_refs = exts, len(refs), refs
+
+cdef bint is_code_file(const char *name) nogil:
+    cdef const char *dot = strrchr(name, b'.')
+    if dot == NULL:
+        return False
+    cdef Py_ssize_t i
+    for i in range(_n_exts):
+        if strcmp(dot + 1, _exts[i]) == 0:
+            return True
+    return False
+
+def classify_directory(path, bint by_inode=False):
+    """
+    Same contract as scanner.classify_directory():
+    returns (is_repo, has_code, subdirs) for one directory.
+    """
+    cdef bytes bpath = os.fsencode(path)
+    cdef bytes bprefix = os.path.join(bpath, b'')
+    prefix = os.path.join(path, '')
+    cdef bint is_repo = False
+    cdef bint has_code = False
+    cdef list subdirs = []
+    cdef DIR *d
+    cdef dirent *e
+    cdef unsigned char d_type
+    cdef struct_stat st
+
+    d = opendir(bpath)
+    if d == NULL:
+        # Unreadable directories are skipped, like os.walk does
+        return False, False, subdirs
+
+    try:
+        while True:
+            with nogil:
+                e = readdir(d)
+            if e == NULL:
+                break
+
+            d_type = e.d_type
+            if d_type == DT_UNKNOWN:
+                # Some filesystems don't report types; fall back to lstat
+                if lstat(bprefix + <bytes>e.d_name, &st) != 0:
+                    d_type = DT_REG
+                elif S_ISDIR(st.st_mode):
+                    d_type = DT_DIR
+                elif S_ISLNK(st.st_mode):
+                    d_type = DT_LNK
+                else:
+                    d_type = DT_REG
+
+            if d_type == DT_DIR:
+                if strcmp(e.d_name, b'.git') == 0:
+                    is_repo = True
+                elif strcmp(e.d_name, b'.') != 0 and strcmp(e.d_name, b'..') != 0:
+                    name = PyUnicode_DecodeFSDefault(e.d_name)
+                    if by_inode:
+                        subdirs.append((e.d_ino, prefix + name))
+                    else:
+                        subdirs.append(prefix + name)
+            elif not has_code and is_code_file(e.d_name):
+                # Like os.walk's `files`, anything that doesn't resolve to a
+                # directory counts, so symlinks are followed (dangling ones count too)
+                if d_type == DT_LNK:
+                    has_code = stat(bprefix + <bytes>e.d_name, &st) != 0 or not S_ISDIR(st.st_mode)
+                else:
+                    has_code = True
+    finally:
+        closedir(d)
+
+    if by_inode:
+        subdirs = [subdir for _, subdir in sorted(subdirs)]
+
+    return is_repo, has_code, subdirs
@@ -1,8 +1,22 @@
 #!/usr/bin/env python3
 import os
 import argparse
+import atexit
+import configparser
+import json
+import selectors
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pygit2
+except ImportError:
+    # Optional: libgit2 bindings let us check status in-process.
+    pygit2 = None
 
 # Common source code extensions to identify code directories
 CODE_EXTENSIONS = {
@@ -10,11 +24,350 @@ CODE_EXTENSIONS = {
     '.go', '.rs', '.rb', '.php', '.html', '.css', '.sh', '.bat', 
     '.json', '.xml', '.yml', '.yaml', '.md'
 }
+# Directories that hold generated files or dependencies, never project roots.
+# The walk doesn't descend into them (disable with --no-prune).
+PRUNE_DIRS = frozenset({
+    'node_modules', '.venv', 'venv', '__pycache__', '.mypy_cache', '.pytest_cache',
+    'target', 'dist', 'build', '.tox', '.gradle', '.idea', '.vscode'
+})
+
+# Extensions without the dot, for a single hash lookup per file name.
+# (str.endswith(tuple) and regex alternations both test every extension in turn.)
+# Every entry in CODE_EXTENSIONS is a single suffix like '.py', so the text
+# after the last dot is all that needs checking.
+_CODE_EXT_NAMES = frozenset(ext[1:] for ext in CODE_EXTENSIONS)
+
+try:
+    # Optional: compiled classify_directory() (cythonize -i _scan.pyx)
+    import _scan
+except ImportError:
+    _scan = None
+else:
+    _scan.set_code_extensions(CODE_EXTENSIONS)
+
+# Status checks must not take .git/index.lock to write back refreshed stat info:
+# parallel scans would contend on it, and it could collide with the user's own git.
+GIT_ENV = dict(os.environ, GIT_OPTIONAL_LOCKS='0')
+# Resolved once, so spawning git doesn't search PATH on every call
+GIT_PATH = shutil.which('git')
+
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'git-scanner'
+)
+STATUS_CACHE_FILE = os.path.join(CACHE_DIR, 'status.json')
+TREE_CACHE_FILE = os.path.join(CACHE_DIR, 'tree.json')
+
+# Bumped whenever the meaning of a cached listing changes
+TREE_CACHE_VERSION = 2
+
+# Directories modified this recently may still change within the same mtime tick,
+# so their listings are not cached (like git's "racily clean" index entries).
+TREE_CACHE_RACY_SECONDS = 2
+
+# repo path -> {'key': [...], 'status': {...}}; None while caching is disabled
+_status_cache = None
+
+# {'old': listings loaded from disk, 'new': listings made this run,
+#  'roots': scanned roots, 'cutoff_ns': racy mtime threshold}; None while disabled
+_tree_cache = None
+
+def load_json_cache(path):
+    """
+    Reads a cache file written by save_json_cache().
+    Returns an empty dict if it is missing or unreadable.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_json_cache(path, data):
+    """
+    Writes a cache file atomically. Failures are ignored: a cache is optional.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def enable_status_cache(refresh=False):
+    """
+    Loads the on-disk status cache and flushes it back when the program exits.
+    With `refresh`, previous entries are discarded and every repo is checked again.
+    """
+    global _status_cache
+    _status_cache = {} if refresh else load_json_cache(STATUS_CACHE_FILE)
+    atexit.register(save_json_cache, STATUS_CACHE_FILE, _status_cache)
+
+def enable_tree_cache(refresh=False):
+    """
+    Loads the on-disk directory listing cache and flushes it back when the program exits.
+    With `refresh`, previous listings are discarded and every directory is read again.
+    """
+    global _tree_cache
+    old = {} if refresh else load_json_cache(TREE_CACHE_FILE)
+    if old.get('version') != TREE_CACHE_VERSION or old.get('extensions') != sorted(CODE_EXTENSIONS):
+        # has_code was computed by other rules or for a different extension set
+        old = {}
+    dirs = old.get('dirs')
+    _tree_cache = {
+        'old': dirs if isinstance(dirs, dict) else {},
+        'new': {},
+        'roots': [],
+        'cutoff_ns': int((time.time() - TREE_CACHE_RACY_SECONDS) * 1e9)
+    }
+    atexit.register(save_tree_cache)
+
+def save_tree_cache():
+    """
+    Writes the listings made this run. Listings under a scanned root that were
+    not revisited (deleted, or now inside a repo) are dropped; others are kept.
+    """
+    prefixes = tuple(os.path.join(root, '') for root in _tree_cache['roots'])
+    dirs = {
+        path: entry for path, entry in _tree_cache['old'].items()
+        if path not in _tree_cache['roots'] and not path.startswith(prefixes)
+    }
+    dirs.update(_tree_cache['new'])
+    save_json_cache(TREE_CACHE_FILE, {
+        'version': TREE_CACHE_VERSION,
+        'extensions': sorted(CODE_EXTENSIONS),
+        'dirs': dirs
+    })
+
+def status_cache_key(repo_path):
+    """
+    Fingerprints the files git rewrites when the index, HEAD or packed refs change.
+    Uses only stat calls; a missing file contributes None.
+    """
+    git_prefix = os.path.join(repo_path, '.git', '')
+    key = []
+    for name in ('index', 'HEAD', 'packed-refs'):
+        try:
+            key.append(os.stat(git_prefix + name).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return key
+
+def read_ref(git_prefix, ref):
+    """
+    Resolves a ref (e.g. 'refs/heads/main') to a commit SHA by reading the loose
+    ref file, or packed-refs if there is none. Returns None if it can't be found.
+    """
+    try:
+        with open(git_prefix + ref, encoding='utf-8', errors='surrogateescape') as f:
+            sha = f.read().strip()
+        # A symbolic ref ('ref: ...') isn't resolved here
+        return None if sha.startswith('ref:') else sha
+    except OSError:
+        pass
+
+    try:
+        with open(git_prefix + 'packed-refs', encoding='utf-8', errors='surrogateescape') as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+def read_branch_refs(repo_path):
+    """
+    Reads the commit of HEAD and of its upstream branch straight from the files
+    in .git (HEAD, config, refs/, packed-refs), without running git.
+    Returns (head_sha, upstream_sha); either is None when there is none
+    (unborn HEAD, detached HEAD, no upstream) or it can't be read simply.
+    """
+    git_prefix = os.path.join(repo_path, '.git', '')
+    try:
+        with open(git_prefix + 'HEAD', encoding='utf-8', errors='surrogateescape') as f:
+            head = f.read().strip()
+    except OSError:
+        return None, None
+
+    if not head.startswith('ref: refs/heads/'):
+        # Detached HEAD holds the SHA itself and has no upstream
+        return head or None, None
+
+    ref = head[len('ref: '):]
+    head_sha = read_ref(git_prefix, ref)
+
+    # [branch "main"] remote = origin, merge = refs/heads/main
+    config = configparser.RawConfigParser(strict=False, allow_no_value=True)
+    try:
+        # git config isn't necessarily UTF-8 (e.g. a latin-1 user.name);
+        # undecodable bytes are kept as surrogates and don't affect the keys read here.
+        with open(git_prefix + 'config', encoding='utf-8', errors='surrogateescape') as f:
+            config.read_string(f.read())
+    except (configparser.Error, UnicodeError, OSError):
+        return head_sha, None
+    section = f'branch "{ref[len("refs/heads/"):]}"'
+    remote = config.get(section, 'remote', fallback=None)
+    merge = config.get(section, 'merge', fallback=None)
+    if not remote or not merge or not merge.startswith('refs/heads/'):
+        return head_sha, None
+
+    if remote == '.':
+        # Tracking another local branch
+        upstream_ref = merge
+    else:
+        # Assumes the default fetch refspec (refs/heads/* -> refs/remotes/<remote>/*)
+        upstream_ref = f'refs/remotes/{remote}/{merge[len("refs/heads/"):]}'
+    return head_sha, read_ref(git_prefix, upstream_ref)
 
 def get_git_status(repo_path):
     """
     Checks the git status of a repository.
     Returns a dictionary with 'is_dirty', 'unpushed_commits', etc.
+    Uses pygit2 (in-process) when available, otherwise the git CLI.
+    With the status cache enabled, an unchanged repo is answered from the cache.
+    """
+    if _status_cache is not None:
+        cache_path = os.path.abspath(repo_path)
+        # Fingerprint before checking, so changes made meanwhile invalidate the entry
+        key = status_cache_key(repo_path)
+        head_sha, upstream_sha = read_branch_refs(repo_path)
+        key.append(head_sha)
+        entry = _status_cache.get(cache_path)
+        # An entry of any other shape is treated as a miss and overwritten below
+        if (isinstance(entry, dict) and entry.get('key') == key
+                and isinstance(entry.get('status'), dict)
+                and entry['status'].keys() >= {'is_dirty', 'unpushed', 'error'}):
+            status = dict(entry['status'])
+            if entry.get('upstream') == upstream_sha:
+                return status
+            if upstream_sha is None or upstream_sha == head_sha:
+                # Only the upstream moved (push/fetch), so the dirty check still holds,
+                # and an upstream at our own commit leaves nothing unpushed.
+                # Otherwise counting commits ahead needs git after all.
+                status['unpushed'] = False
+                _status_cache[cache_path] = {'key': key, 'upstream': upstream_sha, 'status': status}
+                return dict(status)
+
+    status = None
+    if pygit2 is not None:
+        try:
+            status = get_git_status_pygit2(repo_path)
+        except Exception:
+            # Unusual layouts (e.g. unsupported extensions): let git decide.
+            pass
+
+    if status is None:
+        status = get_git_status_subprocess(repo_path)
+
+    if _status_cache is not None and not status['error']:
+        _status_cache[cache_path] = {'key': key, 'upstream': upstream_sha, 'status': status}
+
+    return status
+
+def get_git_status_pygit2(repo_path):
+    """
+    Checks the git status of a repository in-process via libgit2.
+    Opens the repository once and reuses its index/refs for both checks.
+    """
+    status = {
+        'is_dirty': False,
+        'unpushed': False,
+        'error': None
+    }
+
+    repo = pygit2.Repository(repo_path)
+
+    # Any file that isn't unchanged (or merely ignored) makes the repo dirty
+    unchanged = (pygit2.GIT_STATUS_CURRENT, pygit2.GIT_STATUS_IGNORED)
+    status['is_dirty'] = any(s not in unchanged for s in repo.status(untracked_files='normal').values())
+
+    # Check for unpushed commits (against upstream)
+    if not repo.head_is_unborn and not repo.head_is_detached:
+        head = repo.head
+        upstream = repo.branches[head.shorthand].upstream
+        if upstream is not None:
+            ahead, _behind = repo.ahead_behind(head.target, upstream.target)
+            status['unpushed'] = ahead > 0
+
+    return status
+
+def read_fds(*fds):
+    """
+    Reads from several file descriptors until each reaches EOF, then closes them.
+    They are drained together, so a child can't block writing to one pipe
+    while we wait on another. Returns one bytes object per descriptor.
+    """
+    chunks = {fd: [] for fd in fds}
+    try:
+        with selectors.DefaultSelector() as selector:
+            for fd in fds:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        chunks[key.fd].append(chunk)
+                    else:
+                        selector.unregister(key.fd)
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return tuple(b''.join(chunks[fd]) for fd in fds)
+
+def run_git(args):
+    """
+    Runs git with `args` (and GIT_ENV).
+    Returns (returncode, stdout, stderr), with output decoded as text.
+    Uses os.posix_spawn with two bare pipes where available: the output of a
+    status call is tiny, and subprocess.run's Popen setup dominates its cost.
+    """
+    if GIT_PATH is None:
+        raise FileNotFoundError("git executable not found in PATH")
+
+    if not hasattr(os, 'posix_spawn'):
+        # Windows, or Python < 3.8
+        result = subprocess.run([GIT_PATH] + args, env=GIT_ENV,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        return result.returncode, result.stdout.decode(errors='replace'), result.stderr.decode(errors='replace')
+
+    # os.pipe() descriptors are close-on-exec, so only the dup2'd copies reach
+    # this child, and none leak into git processes spawned by other threads.
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        pid = os.posix_spawn(GIT_PATH, ['git'] + args, GIT_ENV, file_actions=[
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ])
+    except OSError:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+
+    # Both pipes are drained together: git can write plenty to stderr (e.g. a
+    # warning per unreadable directory) and would block once that pipe fills.
+    # The child is reaped only after both reach EOF.
+    stdout, stderr = read_fds(out_r, err_r)
+    _, wait_status = os.waitpid(pid, 0)
+    if os.WIFEXITED(wait_status):
+        returncode = os.WEXITSTATUS(wait_status)
+    else:
+        returncode = -os.WTERMSIG(wait_status)
+    return returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
+def get_git_status_subprocess(repo_path):
+    """
+    Checks the git status of a repository using the git CLI.
+    Returns a dictionary with 'is_dirty', 'unpushed_commits', etc.
     """
     status = {
         'is_dirty': False,
@@ -23,125 +376,274 @@ def get_git_status(repo_path):
     }
     
     try:
-        # Check for uncommitted changes
-        result = subprocess.run(
-            ['git', 'status', '--porcelain'], 
-            cwd=repo_path, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            text=True, 
-            check=False
+        # A single call reports both: entry lines mean uncommitted changes,
+        # and the '# branch.ab +N -M' header gives ahead/behind vs upstream
+        # (it is omitted when no upstream is configured).
+        returncode, stdout, stderr = run_git(
+            ['--no-optional-locks', '-C', repo_path, 'status', '--porcelain=v2', '--branch']
         )
-        if result.returncode != 0:
-            status['error'] = result.stderr.strip()
+        if returncode != 0:
+            status['error'] = stderr.strip()
             return status
             
-        if result.stdout.strip():
-            status['is_dirty'] = True
-            
-        # Check for unpushed commits (against upstream)
-        # First check if there is an upstream configured
-        result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', '--symbolic-full-name', '@{u}'],
-            cwd=repo_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False
-        )
-        
-        if result.returncode == 0:
-            # Upstream exists, check for unpushed
-            result = subprocess.run(
-                ['git', 'log', '@{u}..'],
-                cwd=repo_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False
-            )
-            if result.stdout.strip():
-                status['unpushed'] = True
+        for line in stdout.splitlines():
+            if not line.startswith('#'):
+                status['is_dirty'] = True
+            elif line.startswith('# branch.ab '):
+                ahead = line.split()[2]
+                status['unpushed'] = int(ahead[1:]) > 0
                 
     except Exception as e:
         status['error'] = str(e)
         
     return status
 
-def scan_directory(root_dir, verbose=False):
+def classify_directory(path, by_inode=False):
+    """
+    Lists a directory once.
+    Returns (is_repo, has_code, subdirs): whether it contains a `.git` directory,
+    whether any file in it has a code extension, and the paths of its subdirectories.
+    Symlinked directories are not followed, matching os.walk's default.
+    With `by_inode`, subdirs are ordered by inode number instead of listing order.
+    """
+    if _scan is not None:
+        return _scan.classify_directory(path, by_inode)
+
+    is_repo = False
+    has_code = False
+    subdirs = []
+
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == '.git':
+                        is_repo = True
+                    elif by_inode:
+                        # inode() comes from the directory listing on POSIX; no stat needed
+                        subdirs.append((entry.inode(), entry.path))
+                    else:
+                        # DirEntry.path is already joined by scandir; no os.path.join needed
+                        subdirs.append(entry.path)
+                elif not has_code:
+                    # Strategy: Check if any file has a code extension.
+                    # Once one matches, the remaining files need no checks.
+                    # Like os.walk's `files`, anything that doesn't resolve to a
+                    # directory counts, symlinked files included; is_dir() only
+                    # stats symlinks, and only for names that already match.
+                    _, dot, ext = entry.name.rpartition('.')
+                    if dot and ext in _CODE_EXT_NAMES and not entry.is_dir():
+                        has_code = True
+    except OSError:
+        # Unreadable directories are skipped, like os.walk does
+        pass
+
+    if by_inode:
+        subdirs = [subdir for _, subdir in sorted(subdirs)]
+
+    return is_repo, has_code, subdirs
+
+def classify_directory_cached(path, by_inode=False):
+    """
+    classify_directory() backed by the tree cache.
+    A directory's mtime and size change whenever an entry is added, removed or
+    renamed in it, so a matching fingerprint means its listing is unchanged and
+    one stat call replaces reading it. Subdirectories are still visited (and
+    fingerprinted) individually, since their changes don't touch the parent.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False, []
+
+    key = [st.st_mtime_ns, st.st_size]
+    prefix = os.path.join(path, '')
+    entry = _tree_cache['old'].get(path)
+    # Anything but [mtime, size, is_repo, has_code, names] is treated as a miss
+    if (isinstance(entry, list) and len(entry) == 5 and entry[:2] == key
+            and isinstance(entry[4], list) and all(isinstance(name, str) for name in entry[4])):
+        is_repo, has_code, names = entry[2:]
+        _tree_cache['new'][path] = entry
+        return is_repo, has_code, [prefix + name for name in names]
+
+    is_repo, has_code, subdirs = classify_directory(path, by_inode)
+    if st.st_mtime_ns < _tree_cache['cutoff_ns']:
+        names = [subdir[len(prefix):] for subdir in subdirs]
+        _tree_cache['new'][path] = key + [is_repo, has_code, names]
+    return is_repo, has_code, subdirs
+
+def walk_tree(root_dir, threads=1, prune=True, by_inode=False):
+    """
+    Walks the directory tree on `threads` worker threads.
+    Yields (path, is_repo, has_code) for every directory visited, in no particular order.
+    With `prune`, directories named in PRUNE_DIRS are not visited.
+    With `by_inode`, siblings are visited in ascending inode order, which keeps
+    reads on rotational disks close to each other on the platter.
+    Workers share one LIFO stack of pending directories, so each tends to keep
+    descending into the subtree it just listed (good for dentry cache locality),
+    while I/O waits on slow or cold filesystems overlap across threads.
+    """
+    classify = classify_directory if _tree_cache is None else classify_directory_cached
+    pending = [root_dir]
+    state = {'tasks': 1}  # directories pushed but not yet fully processed
+    on_input = threading.Condition()
+    output = []  # results not yet handed to the consumer; None marks the end, an exception aborts
+    on_output = threading.Condition()
+
+    def worker():
+        while True:
+            with on_input:
+                while not pending and state['tasks']:
+                    on_input.wait()
+                if not pending:
+                    # Nothing left anywhere: the walk is complete
+                    return
+                path = pending.pop()
+
+            subdirs = []
+            try:
+                is_repo, has_code, subdirs = classify(path, by_inode)
+                with on_output:
+                    output.append((path, is_repo, has_code))
+                    on_output.notify()
+
+                # Use logic: do we want to scan INSIDE this repo for other repos?
+                # User said: "not submodules! just repos". 
+                # Usually nested repos are submodules. 
+                # If we STOP walking into this dir's subdirs, we strictly respect the "top level repos" logic 
+                # unless there's a repo inside a repo that isn't a submodule. 
+                # But the safer, low-overhead approach is usually to NOT recurse into a git repo.
+                # However, sometimes users have 'projects/ProjectA' (git) and 'projects/ProjectB' (git).
+                # The walk handles siblings fine. This decision is about children of a git repo: we don't push `subdirs`.
+                # I will choose to PRUNE traversal here to avoid scanning node_modules, etc.
+                if is_repo:
+                    subdirs = []
+                elif prune:
+                    subdirs = [d for d in subdirs if d.rpartition(os.sep)[2] not in PRUNE_DIRS]
+                if by_inode:
+                    # The stack pops from the end, so push the lowest inode last
+                    subdirs.reverse()
+            except BaseException as e:
+                # Hand the error to the consumer to re-raise; otherwise the walk
+                # would end early or wait forever on a dead worker
+                with on_output:
+                    output.append(e)
+                    on_output.notify()
+                return
+            finally:
+                with on_input:
+                    # We CONTINUE walking into subdirs because maybe there's a git repo deep inside a non-git folder.
+                    # E.g. /home/user/projects (no git) -> /home/user/projects/repo1 (git)
+                    pending.extend(subdirs)
+                    state['tasks'] += len(subdirs) - 1
+                    if not state['tasks']:
+                        # Every result is queued before its task is retired
+                        with on_output:
+                            output.append(None)
+                            on_output.notify()
+                        on_input.notify_all()
+                    elif subdirs:
+                        on_input.notify(len(subdirs))
+
+    for _ in range(threads):
+        threading.Thread(target=worker, daemon=True).start()
+
+    while True:
+        # Take everything produced so far in one go, rather than waking per item
+        with on_output:
+            while not output:
+                on_output.wait()
+            batch = output[:]
+            del output[:]
+        for item in batch:
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+def scan_directory(root_dir, verbose=False, jobs=None, threads=1, prune=True, by_inode=False):
     """
     Walks the directory tree.
     - Specifies if a directory is a Git Repo.
     - If not a repo, checks if it contains code files (Uninitialized).
     - Ignores directories inside existing Git Repos (no nested scanning unless submodule logic needed, but user said 'no submodules').
+    - Skips dependency/build output directories (PRUNE_DIRS) unless `prune` is False.
+    - Visits directories in inode order if `by_inode` is set (helps on HDDs).
+    - Lists directories on `threads` threads and checks the status of found repos
+      concurrently on `jobs` threads, starting as soon as each repo is found.
     """
     
-    print(f"Scanning {os.path.abspath(root_dir)}...\n")
+    # Absolute paths keep the on-disk caches independent of the working directory
+    root_dir = os.path.abspath(root_dir)
+    print(f"Scanning {root_dir}...\n")
+    if _tree_cache is not None:
+        _tree_cache['roots'].append(root_dir)
     
     found_repos = []
+    repo_paths = []
+    futures = []
     uninitialized_dirs = []
     
-    # os.walk allows modifying 'dirs' in-place to prune traversal
-    for current_root, dirs, files in os.walk(root_dir):
-        # specific check to skip .git directories themselves from being walked
-        if '.git' in dirs:
-            # This directory is a git repo
-            dirs.remove('.git') # don't walk into .git
-            
-            # Determine status
-            git_stat = get_git_status(current_root)
-            
+    # Each status check is dominated by waiting on git, so threads are enough.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for current_root, is_repo, has_code in walk_tree(root_dir, threads, prune, by_inode):
+            if is_repo:
+                # Determine status in the background while the walk goes on
+                repo_paths.append(current_root)
+                futures.append(executor.submit(get_git_status, current_root))
+                continue
+                
+            # If not a git repo, check if it looks like code
+            # We only care if it's a "project root" candidate.
+            # Simple heuristic: has code files.
+            # But we don't want to list EVERY subdirectory.
+            # We want to find "roots".
+            # If we are effectively a leaf or near-leaf with code, report it.
+            # Actually, for "What directories have code in it, but has not yet been initialized",
+            # users usually mean "I have a project folder here that I forgot to git init".
+            # If I see ANY code file in this dir, I'll flag it, BUT...
+            # If I recurse, I might flag current_root AND current_root/src.
+            # To avoid noise, maybe only flag if verify strictly?
+            # Let's just collect all and maybe filter path containment later?
+            if has_code:
+                uninitialized_dirs.append(current_root)
+
+        for path, future in zip(repo_paths, futures):
             repo_info = {
-                'path': current_root,
-                'status': git_stat
+                'path': path,
+                'status': future.result()
             }
             found_repos.append(repo_info)
             
-            # Use logic: do we want to scan INSIDE this repo for other repos?
-            # User said: "not submodules! just repos". 
-            # Usually nested repos are submodules. 
-            # If we STOP walking into this dir's subdirs, we strictly respect the "top level repos" logic 
-            # unless there's a repo inside a repo that isn't a submodule. 
-            # But the safer, low-overhead approach is usually to NOT recurse into a git repo.
-            # However, sometimes users have 'projects/ProjectA' (git) and 'projects/ProjectB' (git).
-            # The walk handles siblings fine. This decision is about children of a git repo using `dirs[:] = []`.
-            # I will choose to PRUNE traversal here to avoid scanning node_modules, etc.
-            dirs[:] = [] 
-            continue
-            
-        # If not a git repo, check if it looks like code
-        # We only care if it's a "project root" candidate.
-        # Simple heuristic: has code files.
-        # But we don't want to list EVERY subdirectory.
-        # We want to find "roots".
-        # If we are effectively a leaf or near-leaf with code, report it.
-        # Actually, for "What directories have code in it, but has not yet been initialized",
-        # users usually mean "I have a project folder here that I forgot to git init".
-        # If I see ANY code file in this dir, I'll flag it, BUT...
-        # If I recurse, I might flag current_root AND current_root/src.
-        # To avoid noise, maybe only flag if verify strictly?
-        # Let's just collect all and maybe filter path containment later?
-        # Strategy: Check if any file in `files` has a code extension.
-        
-        has_code = any(f.endswith(tuple(CODE_EXTENSIONS)) for f in files)
-        if has_code:
-            uninitialized_dirs.append(current_root)
-            # We CONTINUE walking into subdirs because maybe there's a git repo deep inside a non-git folder.
-            # E.g. /home/user/projects (no git) -> /home/user/projects/repo1 (git)
-            
     return found_repos, uninitialized_dirs
 
 def print_report(repos, uninit, root_dir):
-    print(f"{'='*60}")
-    print(f"GIT REPOSITORIES FOUND: {len(repos)}")
-    print(f"{'='*60}")
+    # The report is built as a list of lines and written in a single call,
+    # instead of one print() (and stdout lock round-trip) per repository.
+    out = []
+    out.append(f"{'='*60}")
+    out.append(f"GIT REPOSITORIES FOUND: {len(repos)}")
+    out.append(f"{'='*60}")
+
+    # Scanned paths are absolute and normally under the root, so slicing off
+    # the root prefix gives the relative path without os.path.relpath's
+    # normalization work; relpath is only needed for anything else.
+    root_abs = os.path.abspath(root_dir)
+    root_prefix = os.path.join(root_abs, '')
+    def rel(path):
+        if path == root_abs:
+            return '.'
+        if path.startswith(root_prefix):
+            return path[len(root_prefix):]
+        return os.path.relpath(path, root_dir)
     
     # Sort by path
     repos.sort(key=lambda x: x['path'])
     
     for r in repos:
         path = r['path']
-        rel_path = os.path.relpath(path, root_dir)
+        rel_path = rel(path)
         status = r['status']
         
         # Formatting
@@ -168,46 +670,76 @@ def print_report(repos, uninit, root_dir):
         else:
             icon = "[OK]"
             
-        print(f"{icon} {rel_path}  =>  {', '.join(status_str)}")
+        out.append(f"{icon} {rel_path}  =>  {', '.join(status_str)}")
 
     if uninit:
-        print(f"\n{'='*60}")
-        print(f"UNINITIALIZED CODE DIRECTORIES (Potential Projects): {len(uninit)}")
-        print(f"(Showing top-level non-nested matches to reduce noise)")
-        print(f"{'='*60}")
+        out.append(f"\n{'='*60}")
+        out.append(f"UNINITIALIZED CODE DIRECTORIES (Potential Projects): {len(uninit)}")
+        out.append(f"(Showing top-level non-nested matches to reduce noise)")
+        out.append(f"{'='*60}")
         
         # Filter: If /a/b is in list, and /a/b/c is in list, hide /a/b/c?
         # Yes, we want the 'root' of the uninitialized code.
-        uninit.sort()
+        # Sort by path components (not raw strings, where 'a-b' sorts between
+        # 'a' and 'a/b') so every directory directly follows its ancestors.
+        uninit.sort(key=lambda d: d.split(os.sep))
         filtered_uninit = []
+        parent_prefix = None
         for d in uninit:
-            # Check if this d is a subdirectory of any already in filtered_uninit
+            # Check if this d is a subdirectory of the last kept entry
             # path/to/parent vs path/to/parent/child
-            is_child = False
-            for parent in filtered_uninit:
-                # Add slash to ensure strict directory prefix matching
-                if d.startswith(os.path.join(parent, '')):
-                    is_child = True
-                    break
-            if not is_child:
+            # If any kept entry is an ancestor of d, the most recently kept one is,
+            # so one comparison suffices.
+            # Add slash to ensure strict directory prefix matching
+            if parent_prefix is None or not d.startswith(parent_prefix):
                 filtered_uninit.append(d)
+                parent_prefix = os.path.join(d, '')
                 
         for d in filtered_uninit:
-            rel_path = os.path.relpath(d, root_dir)
-            print(f"[?] {rel_path}")
+            out.append(f"[?] {rel(d)}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def main():
     parser = argparse.ArgumentParser(description="Scan directories for git repositories and uninitialized code.")
     parser.add_argument('path', nargs='?', default=os.getcwd(), help="Root directory to scan (default: current)")
     parser.add_argument('--verbose', action='store_true', help="Show more details")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Number of repositories to check in parallel (default: CPU count)")
+    parser.add_argument('--threads', type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help="Number of threads listing directories (default: 4x CPU count, at most 32)")
+    parser.add_argument('--cache-status', action='store_true',
+                        help="Reuse statuses from earlier scans for repos whose index, HEAD and packed refs are unchanged")
+    parser.add_argument('--no-prune', action='store_true',
+                        help="Also scan dependency and build directories (node_modules, .venv, build, ...)")
+    parser.add_argument('--optimize', choices=['platter'],
+                        help="'platter': visit directories in inode order to reduce seeks on spinning disks")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't read or write any cache (directory listings or statuses)")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Ignore cached results from earlier scans and rebuild the caches")
     
     args = parser.parse_args()
     
     if not os.path.isdir(args.path):
         print(f"Error: Directory '{args.path}' not found.")
         sys.exit(1)
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1.")
+        sys.exit(1)
+
+    if args.threads < 1:
+        print("Error: --threads must be at least 1.")
+        sys.exit(1)
+
+    if not args.no_cache:
+        enable_tree_cache(args.refresh)
+        if args.cache_status:
+            enable_status_cache(args.refresh)
         
-    repos, uninit = scan_directory(args.path, args.verbose)
+    repos, uninit = scan_directory(args.path, args.verbose, args.jobs, args.threads,
+                                  prune=not args.no_prune, by_inode=args.optimize == 'platter')
     print_report(repos, uninit, args.path)
 
 if __name__ == "__main__":